@@ -1,15 +1,17 @@
 import cv2
+import numpy as np
 import customtkinter as ctk
-from ultralytics import YOLO
 import ctypes
 import threading
+import queue
 import sqlite3
 import os
-import pandas as pd
 from datetime import datetime
-from tkinter import messagebox
+from tkinter import messagebox, ttk
 import time
 import sys
+import functools
+import glob
 
 # TRAY imports
 import pystray
@@ -36,18 +38,170 @@ APP_DATA_PATH = get_app_data_path()
 DB_PATH = os.path.join(APP_DATA_PATH, "compliance_logs.db")
 ALERTS_DIR = os.path.join(APP_DATA_PATH, "Alerts")
 MODEL_PATH = resource_path("yolov8n.pt")
+ENGINE_MODEL_PATH = resource_path("yolov8n.engine")  # INT8 TensorRT (NVIDIA)
+OPENVINO_MODEL_PATH = resource_path("yolov8n_int8_openvino_model")  # INT8 OpenVINO IR (CPU)
+CALIB_DIR = os.path.join(ALERTS_DIR, "calib")
+MIN_CALIB_FRAMES = 200
+
+# Detection
+PHONE_CLASS_ID = 67  # COCO "cell phone"
+MODEL_IMGSZ = 320
+# Square input matches imgsz, so Ultralytics skips its letterbox pad/copy.
+# The aspect squash is fine for a "phone present?" decision.
+MODEL_INPUT_SIZE = (MODEL_IMGSZ, MODEL_IMGSZ)
+TARGET_FRAME_PERIOD = 1.0 / 30.0  # seconds per inference loop at 30 FPS
+MOTION_THRESH = 5000  # sum of abs diff over an 80x60 grayscale frame
+MOTION_SAFETY_INTERVAL = 10  # run YOLO at least every Nth frame even without motion
+JPEG_QUALITY = 85  # evidence photos, ~half the size of OpenCV's default 95
+WRITE_BATCH_SIZE = 16
+WRITE_BATCH_WINDOW = 0.5  # seconds the writer waits to fill a batch
 TRAY_ICON_PATH = resource_path("SafedeskAI.ico")
 
 os.makedirs(ALERTS_DIR, exist_ok=True)
 
 # Database
-conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+def open_db(check_same_thread=True):
+    """New connection with the per-connection pragmas applied"""
+    db = sqlite3.connect(DB_PATH, check_same_thread=check_same_thread)
+    db.row_factory = sqlite3.Row  # must be set before cursors are created
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute("PRAGMA busy_timeout=5000")
+    db.execute("PRAGMA temp_store=MEMORY")
+    db.execute("PRAGMA cache_size=-20000")
+    return db
+
+
+# UI thread connection; the violation writer and export threads open their own
+conn = open_db(check_same_thread=False)
 cursor = conn.cursor()
+# Persistent WAL: with the writer on its own connection, UI reads and writer commits don't block each other
+cursor.execute("PRAGMA journal_mode=WAL")
 cursor.execute('''CREATE TABLE IF NOT EXISTS violations 
                  (id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT, 
                   employee_name TEXT, object_detected TEXT, image_path TEXT)''')
+cursor.execute("CREATE INDEX IF NOT EXISTS idx_violations_ts ON violations(timestamp DESC)")
 conn.commit()
 
+# Hot queries
+INSERT_VIOLATION_SQL = ('INSERT INTO violations (timestamp, employee_name, object_detected, image_path) '
+                        'VALUES (?, ?, ?, ?)')
+RECENT_SQL = "SELECT timestamp, employee_name, object_detected FROM violations ORDER BY id DESC LIMIT 10"
+# Keyset pagination: id is the rowid, so "id < ?" is a B-tree range seek at any depth
+DASHBOARD_PAGE_SQL = "SELECT * FROM violations WHERE id < ? ORDER BY id DESC LIMIT ?"
+DASHBOARD_PAGE_SIZE = 50
+
+
+def cuda_is_available():
+    try:
+        import torch
+        return torch.cuda.is_available()
+    except Exception:
+        return False
+
+
+def select_model_path(cuda_available):
+    """Pick the fastest exported model available for this machine"""
+    if cuda_available and os.path.exists(ENGINE_MODEL_PATH):
+        return ENGINE_MODEL_PATH
+    if not cuda_available and os.path.isdir(OPENVINO_MODEL_PATH):
+        return OPENVINO_MODEL_PATH
+    return MODEL_PATH
+
+
+def load_frame_diff():
+    """Sum of absolute differences for the motion gate: Numba kernel if installed, else OpenCV"""
+    try:
+        from numba import njit  # optional, deferred like ultralytics
+
+        @njit(cache=True, fastmath=True, boundscheck=False)
+        def frame_diff(a, b):
+            s = 0
+            for i in range(a.shape[0]):
+                for j in range(a.shape[1]):
+                    d = int(a[i, j]) - int(b[i, j])
+                    s += d if d >= 0 else -d
+            return s
+
+        # Compile (or load from cache) now rather than on the first monitored frame
+        probe = np.zeros((60, 80), dtype=np.uint8)
+        frame_diff(probe, probe)
+        return frame_diff
+    except Exception:
+        return lambda a, b: cv2.absdiff(a, b).sum()
+
+
+@functools.lru_cache(maxsize=32)
+def load_thumbnail(img_path, mtime):
+    """Decode + shrink an evidence photo; mtime in the key drops stale entries"""
+    img = PILImage.open(img_path)
+    img.thumbnail((650, 480))
+    return img
+
+
+def open_camera():
+    """Webcam set up identically for monitoring and INT8 calibration"""
+    cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
+    # MJPG: camera compresses on-device, libjpeg-turbo decodes (FOURCC must come before size)
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+    cap.set(cv2.CAP_PROP_FPS, 30)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    return cap
+
+
+def capture_calibration_frames(count=300):
+    """Grab representative webcam frames into CALIB_DIR for INT8 calibration"""
+    os.makedirs(CALIB_DIR, exist_ok=True)
+    cap = open_camera()
+    saved = 0
+    try:
+        while saved < count and cap.isOpened():
+            ret, frame = cap.read()
+            if not ret:
+                break
+            # Same preprocessing as _infer_thread, so calibration sees what the model sees
+            model_input = cv2.resize(frame, MODEL_INPUT_SIZE, interpolation=cv2.INTER_AREA)
+            cv2.imwrite(os.path.join(CALIB_DIR, f"calib_{saved:04d}.jpg"), model_input)
+            saved += 1
+            time.sleep(0.1)
+    finally:
+        cap.release()
+    return saved
+
+
+def count_calibration_frames():
+    return len(glob.glob(os.path.join(CALIB_DIR, "calib_*.jpg")))
+
+
+def export_int8_models():
+    """Offline step: export yolov8n.pt to INT8 TensorRT / OpenVINO using webcam calibration frames"""
+    if count_calibration_frames() < MIN_CALIB_FRAMES:
+        print(f"📸 Capturing calibration frames to {CALIB_DIR}...")
+        capture_calibration_frames()
+
+    found = count_calibration_frames()
+    if found < MIN_CALIB_FRAMES:
+        print(f"❌ Only {found} calibration frames in {CALIB_DIR} (need {MIN_CALIB_FRAMES}).\n"
+              f"   Check that the webcam is connected and allowed, then run --export-int8 again.")
+        return False
+
+    from ultralytics import YOLO
+    model = YOLO(MODEL_PATH)
+    calib_yaml = os.path.join(CALIB_DIR, "calib.yaml")
+    with open(calib_yaml, "w", encoding="utf-8") as f:
+        f.write(f"path: {CALIB_DIR}\ntrain: .\nval: .\nnames:\n")
+        for idx, name in model.names.items():
+            f.write(f"  {idx}: {name}\n")
+
+    if cuda_is_available():
+        print("🔄 Exporting INT8 TensorRT engine...")
+        model.export(format="engine", int8=True, data=calib_yaml, imgsz=MODEL_IMGSZ, device=0)
+    print("🔄 Exporting INT8 OpenVINO model...")
+    model.export(format="openvino", int8=True, data=calib_yaml, imgsz=MODEL_IMGSZ)
+    print("✅ Export finished!")
+    return True
+
 
 class SafeDeskApp(ctk.CTk):
     def __init__(self):
@@ -68,11 +222,21 @@ class SafeDeskApp(ctk.CTk):
         self.monitoring = False
         self.model = None
         self.model_loading = False  # Track if model is being loaded
+        self._device = "cpu"
+        self._half = False
         self.cap = None
+        self._latest_frame = None  # newest camera frame, owned by the reader
+        self._frame_lock = threading.Lock()
+        self.write_q = None  # inference -> disk/DB writer
+        self._reader = None
+        self._infer = None
+        self._writer = None
         self.conf_threshold = 0.40
         self.alert_cooldown_seconds = 10
         self.required_streak = 3
         self.detect_streak = 0
+        self._prev_gray = None
+        self._frame_idx = 0
         self.action_mode = "Log Only"
         self.last_alert_time = 0.0
         self.tray_icon = None
@@ -100,13 +264,41 @@ class SafeDeskApp(ctk.CTk):
         """Background thread to load model"""
         try:
             print("🔄 Loading YOLO model in background...")
-            self.model = YOLO(MODEL_PATH)
-            print("✅ Model loaded!")
+            # Deferred: ultralytics pulls in torch and takes seconds to import
+            from ultralytics import YOLO
+            cuda_available = cuda_is_available()
+            # FP16 on GPU; exported INT8 engines ignore it and keep their own precision
+            self._device = 0 if cuda_available else "cpu"
+            self._half = cuda_available
+            model_path = select_model_path(cuda_available)
+            try:
+                model = self._load_and_warm_up(YOLO, model_path)
+            except Exception as e:
+                if model_path == MODEL_PATH:
+                    raise
+                print(f"⚠️ {os.path.basename(model_path)} unusable ({e}), falling back to "
+                      f"{os.path.basename(MODEL_PATH)}")
+                model_path = MODEL_PATH
+                model = self._load_and_warm_up(YOLO, model_path)
+            self.model = model
+            print(f"✅ Model loaded! ({os.path.basename(model_path)})")
             # Update UI from main thread
             self.after(0, self._model_loaded_callback)
         except Exception as e:
             print(f"❌ Model load failed: {e}")
-            self.after(0, lambda: self._model_load_failed(str(e)))
+            self.after(0, lambda err=str(e): self._model_load_failed(err))
+
+    def _load_and_warm_up(self, YOLO, model_path):
+        """Load a model and run one dummy predict with the monitoring args.
+
+        Exported backends (TensorRT/OpenVINO) are only built on the first call, so
+        this is where an engine from another GPU or a missing runtime shows up.
+        """
+        model = YOLO(model_path, task="detect")
+        dummy = np.zeros((MODEL_INPUT_SIZE[1], MODEL_INPUT_SIZE[0], 3), dtype=np.uint8)
+        model(dummy, imgsz=MODEL_IMGSZ, classes=[PHONE_CLASS_ID], device=self._device,
+              half=self._half, verbose=False)
+        return model
 
     def _model_loaded_callback(self):
         """Called when model is loaded"""
@@ -216,17 +408,27 @@ class SafeDeskApp(ctk.CTk):
                 return
 
         if not self.monitoring:
+            if self._workers_alive():
+                messagebox.showinfo("Please Wait", "Previous session is still stopping...\nPlease try again in a moment.")
+                return
+
             self.monitoring = True
             self.detect_streak = 0
+            self._prev_gray = None
+            self._frame_idx = 0
+            self._latest_frame = None
 
-            self.cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-            self.cap.set(cv2.CAP_PROP_FPS, 30)
+            self.cap = open_camera()
 
             if self.cap.isOpened():
+                self.write_q = queue.Queue(maxsize=4)
                 self.status_text.configure(text="🟢 MONITORING LIVE", text_color="#2ecc71")
-                threading.Thread(target=self.update_frame, daemon=True).start()
+                self._reader = threading.Thread(target=self._reader_thread, daemon=True)
+                self._infer = threading.Thread(target=self._infer_thread, daemon=True)
+                self._reader.start()
+                self._infer.start()
+                self._writer = threading.Thread(target=self._writer_thread, daemon=True)
+                self._writer.start()
             else:
                 messagebox.showerror("🚫 Camera Error", "Check Privacy Settings!")
                 self.monitoring = False
@@ -238,9 +440,16 @@ class SafeDeskApp(ctk.CTk):
         self.conf_threshold = float(v)
         self.conf_label.configure(text=f"Confidence: {self.conf_threshold:.2f}")
 
+    def _workers_alive(self):
+        return any(t is not None and t.is_alive() for t in (self._reader, self._infer, self._writer))
+
     def stop_monitoring(self):
         self.monitoring = False
         self.detect_streak = 0
+        # The reader must be out of grab()/retrieve() before the capture is released.
+        # Blocking join is safe here because the reader never calls into Tk.
+        if self._reader is not None:
+            self._reader.join(timeout=2.0)
         if self.cap:
             self.cap.release()
             self.cap = None
@@ -250,25 +459,52 @@ class SafeDeskApp(ctk.CTk):
         else:
             self.status_text.configure(text="🔴 SYSTEM OFFLINE", text_color="gray")
 
-    def update_frame(self):
+    def _reader_thread(self):
+        """Keep draining the camera and publish only the newest frame"""
         while self.monitoring:
             try:
-                ret, frame = self.cap.read()
-                if not ret or not self.monitoring:
+                if not self.cap.grab() or not self.monitoring:
                     time.sleep(0.1)
                     continue
 
-                # Model already loaded, just use it
-                results = self.model(frame, conf=self.conf_threshold, verbose=False)
-                phone_detected = False
+                ret, frame = self.cap.retrieve()
+                if ret:
+                    with self._frame_lock:
+                        self._latest_frame = frame
+            except Exception as e:
+                print(f"Capture error: {e}")
+                time.sleep(0.1)
 
-                for r in results:
-                    if r.boxes is not None:
-                        for box in r.boxes:
-                            if int(box.cls[0]) == 67:
-                                phone_detected = True
-                                break
-                        if phone_detected: break
+    def _infer_thread(self):
+        """Run YOLO on captured frames and hand violations to the writer"""
+        frame_diff = load_frame_diff()
+        while self.monitoring:
+            loop_start = time.perf_counter()
+            with self._frame_lock:
+                frame, self._latest_frame = self._latest_frame, None
+            if frame is None:
+                time.sleep(0.005)
+                continue
+
+            try:
+                # Motion gate: skip YOLO on static frames
+                small = cv2.resize(frame, (80, 60))
+                gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+                prev_gray, self._prev_gray = self._prev_gray, gray
+                self._frame_idx += 1
+                if prev_gray is not None and self._frame_idx % MOTION_SAFETY_INTERVAL != 0:
+                    if frame_diff(gray, prev_gray) < MOTION_THRESH:
+                        continue  # gated frames cost <1 ms, no pacing needed
+
+                # Model already loaded, just use it
+                model_input = cv2.resize(frame, MODEL_INPUT_SIZE, interpolation=cv2.INTER_AREA)
+                results = self.model(model_input, conf=self.conf_threshold, imgsz=MODEL_IMGSZ,
+                                     classes=[PHONE_CLASS_ID], max_det=5, device=self._device,
+                                     half=self._half, augment=False, agnostic_nms=True,
+                                     verbose=False, stream=False)
+                # One tensor reduction, no per-box Python conversions
+                boxes = results[0].boxes
+                phone_detected = boxes is not None and bool((boxes.cls == PHONE_CLASS_ID).any().item())
 
                 if phone_detected:
                     self.detect_streak += 1
@@ -278,68 +514,139 @@ class SafeDeskApp(ctk.CTk):
                 if self.detect_streak >= self.required_streak:
                     now = time.time()
                     if now - self.last_alert_time >= self.alert_cooldown_seconds:
-                        self.last_alert_time = now
-                        self.after(0, lambda f=frame.copy(): self.save_violation(f))
-                        self.detect_streak = 0
-
-                time.sleep(0.03)
+                        try:
+                            self.write_q.put((frame.copy(), datetime.now()), block=True, timeout=0.1)
+                        except queue.Full:
+                            # Cooldown/streak untouched, so the next detected frame retries
+                            print("Writer queue full, retrying violation on next detection")
+                        else:
+                            self.last_alert_time = now
+                            self.detect_streak = 0
+                            self.run_violation_action()
+
+                # Sleep only for what is left of the frame budget
+                elapsed = time.perf_counter() - loop_start
+                time.sleep(max(0.0, TARGET_FRAME_PERIOD - elapsed))
             except Exception as e:
                 print(f"Frame error: {e}")
                 time.sleep(0.1)
 
-    def save_violation(self, frame):
-        now = datetime.now()
-        timestamp_str = now.strftime("%Y-%m-%d %H:%M:%S")
-        img_name = os.path.join(ALERTS_DIR, f"violation_{now.strftime('%Y%m%d_%H%M%S')}.jpg")
+    def _writer_thread(self):
+        """Save violation photos and batch their DB rows off the inference and UI threads"""
+        db = open_db()  # own connection, so its transactions never interleave with the UI's
+        try:
+            # Outlive the producer: inference may still queue a violation after stop
+            while self.monitoring or self._infer.is_alive() or not self.write_q.empty():
+                try:
+                    batch = [self.write_q.get(timeout=0.1)]
+                except queue.Empty:
+                    continue
 
+                # Collect a burst into one transaction
+                deadline = time.perf_counter() + WRITE_BATCH_WINDOW
+                while len(batch) < WRITE_BATCH_SIZE:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(self.write_q.get(timeout=remaining))
+                    except queue.Empty:
+                        break
+
+                try:
+                    self.save_violations(db, batch)
+                except Exception as e:
+                    print(f"Write error: {e}")
+        finally:
+            db.close()
+
+    def save_violations(self, db, batch):
         try:
             employee_id = os.getlogin()
         except:
             employee_id = "Unknown"
 
-        cv2.imwrite(img_name, frame)
+        rows = []
+        for frame, now in batch:
+            timestamp_str = now.strftime("%Y-%m-%d %H:%M:%S")
+            img_name = os.path.join(ALERTS_DIR, f"violation_{now.strftime('%Y%m%d_%H%M%S')}.jpg")
 
-        if os.path.exists(img_name):
-            cursor.execute(
-                'INSERT INTO violations (timestamp, employee_name, object_detected, image_path) VALUES (?, ?, ?, ?)',
-                (timestamp_str, employee_id, "Mobile Phone", img_name))
-            conn.commit()
+            ok, buf = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+            if not ok:
+                print(f"Encode failed: {img_name}")
+                continue
+            try:
+                with open(img_name, "wb") as f:
+                    f.write(buf.tobytes())
+            except OSError as e:
+                print(f"Photo save failed: {e}")
+                continue
+
+            rows.append((timestamp_str, employee_id, "Mobile Phone", img_name))
+
+        if rows:
+            with db:
+                db.executemany(INSERT_VIOLATION_SQL, rows)
             self.after(0, self.refresh_logs)
 
-            if self.action_mode == "Warn":
-                self.after(0, lambda: messagebox.showwarning("🚨 VIOLATION", "Mobile phone detected!"))
-            elif self.action_mode == "Lock":
-                ctypes.windll.user32.LockWorkStation()
+    def run_violation_action(self):
+        """Warn/Lock as soon as the violation is queued, not after the writer's batch window"""
+        if self.action_mode == "Warn":
+            self.after(0, lambda: messagebox.showwarning("🚨 VIOLATION", "Mobile phone detected!"))
+        elif self.action_mode == "Lock":
+            ctypes.windll.user32.LockWorkStation()
 
     def refresh_logs(self):
         try:
             self.log_box.configure(state="normal")
             self.log_box.delete("1.0", "end")
-            cursor.execute("SELECT timestamp, employee_name, object_detected FROM violations ORDER BY id DESC LIMIT 10")
-            for ts, emp, obj in cursor.fetchall():
-                self.log_box.insert("end", f"🚨 {ts} | {emp} | {obj}\n")
+            # One insert instead of one Tk call per line
+            self.log_box.insert("end", "".join(
+                f"🚨 {r['timestamp']} | {r['employee_name']} | {r['object_detected']}\n"
+                for r in cursor.execute(RECENT_SQL)))
             self.log_box.configure(state="disabled")
         except:
             pass
 
     def export_to_excel_auto_open(self):
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        filename = f"SafeDesk_Report_{timestamp}.xlsx"
+        desktop_path = os.path.join(os.path.expanduser("~"), "Desktop", filename)
+
+        threading.Thread(target=self._do_export,
+                         args=("SELECT * FROM violations ORDER BY id DESC", desktop_path,
+                               "Report export failed", self._report_opened_callback),
+                         daemon=True).start()
+
+    def _report_opened_callback(self):
+        self.status_text.configure(text=f"📊 Report opened!", text_color="#3498db")
+        self.after(3000, lambda: self.status_text.configure(
+            text="🔴 SYSTEM READY (Click Start)" if self.model else "🔴 SYSTEM OFFLINE",
+            text_color="#2ecc71" if self.model else "gray"))
+
+    def _do_export(self, query, desktop_path, error_message, on_opened=None):
+        """Background thread: query + xlsx write, then open on the main thread"""
         try:
-            df = pd.read_sql_query("SELECT * FROM violations ORDER BY id DESC", conn)
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"SafeDesk_Report_{timestamp}.xlsx"
-
-            desktop_path = os.path.join(os.path.expanduser("~"), "Desktop", filename)
-            df.to_excel(desktop_path, index=False)
+            import pandas as pd  # deferred: only needed for exports
+            db = open_db()
+            try:
+                df = pd.read_sql_query(query, db)
+            finally:
+                db.close()
+            # No constant_memory: pandas writes column by column, which that mode truncates
+            with pd.ExcelWriter(desktop_path, engine="xlsxwriter") as writer:
+                df.to_excel(writer, index=False, sheet_name="Violations")
+            self.after(0, lambda: self._open_report(desktop_path, error_message, on_opened))
+        except Exception as e:
+            self.after(0, lambda err=str(e): messagebox.showerror("❌ Error", f"{error_message}:\n{err}"))
 
+    def _open_report(self, desktop_path, error_message, on_opened=None):
+        try:
             os.startfile(desktop_path)
-
-            self.status_text.configure(text=f"📊 Report opened!", text_color="#3498db")
-            self.after(3000, lambda: self.status_text.configure(
-                text="🔴 SYSTEM READY (Click Start)" if self.model else "🔴 SYSTEM OFFLINE",
-                text_color="#2ecc71" if self.model else "gray"))
-
+            if on_opened:
+                on_opened()
         except Exception as e:
-            messagebox.showerror("❌ Error", f"Report export failed:\n{str(e)}")
+            messagebox.showerror("❌ Error", f"{error_message}:\n{str(e)}")
 
     def manager_pin_prompt(self):
         self.manager_pin_window = ctk.CTkToplevel(self)
@@ -380,65 +687,57 @@ class SafeDeskApp(ctk.CTk):
         stats_frame = ctk.CTkFrame(dashboard, fg_color="#1a1a1a")
         stats_frame.pack(fill="x", padx=20, pady=20)
 
-        total_violations = cursor.execute("SELECT COUNT(*) FROM violations").fetchone()[0]
-        today_violations = cursor.execute("""
-            SELECT COUNT(*) FROM violations WHERE DATE(timestamp)=DATE('now')
-        """).fetchone()[0]
-        week_violations = cursor.execute("""
-            SELECT COUNT(*) FROM violations WHERE DATE(timestamp) >= DATE('now', '-7 days')
-        """).fetchone()[0]
+        # Plain timestamp comparisons so the week window is a range scan on idx_violations_ts
+        row = cursor.execute("""
+            SELECT (SELECT COUNT(*) FROM violations),
+                   SUM(CASE WHEN timestamp >= DATE('now') THEN 1 ELSE 0 END),
+                   COUNT(*)
+            FROM violations WHERE timestamp >= DATE('now', '-7 days')
+        """).fetchone()
+        # SUM() is NULL when nothing matched
+        total_violations, today_violations, week_violations = (v or 0 for v in row)
 
         ctk.CTkLabel(stats_frame, text=f"🔴 TOTAL VIOLATIONS: {total_violations}",
                      font=ctk.CTkFont(size=32, weight="bold"), text_color="#e74c3c").pack(pady=20)
         ctk.CTkLabel(stats_frame, text=f"🟢 TODAY: {today_violations} | 📅 THIS WEEK: {week_violations}",
                      font=ctk.CTkFont(size=20)).pack(pady=(0, 20))
 
-        table_frame = ctk.CTkScrollableFrame(dashboard, height=400)
+        table_frame = ctk.CTkFrame(dashboard)
         table_frame.pack(fill="both", expand=True, padx=20, pady=10)
 
-        headers = ["Date & Time", "👤 Employee", "📱 Device", "📸 Photo", "✅ Status"]
-        for col, header in enumerate(headers):
-            lbl = ctk.CTkLabel(table_frame, text=header, font=ctk.CTkFont(size=14, weight="bold"),
-                               width=200 if col < 3 else 100, fg_color="#2b2b2b", height=35)
-            lbl.grid(row=0, column=col, padx=2, pady=10, sticky="ew")
-
-        cursor.execute("SELECT * FROM violations ORDER BY id DESC LIMIT 50")
-        violations = cursor.fetchall()
-
-        for row_idx, row in enumerate(violations, 1):
-            timestamp = row[1]
-            emp_name = row[2]
-            device = row[3]
-            img_path = str(row[4]) if row[4] else ""
-
-            if device and ("C:\\" in str(device) or "violation_" in str(device)):
-                img_path = str(device)
-                device = str(emp_name)
-                try:
-                    emp_name = os.getlogin()
-                except:
-                    emp_name = "User"
-
-            status = "✅ Photo Saved" if os.path.exists(img_path) else "❌ Missing"
-
-            ctk.CTkLabel(table_frame, text=timestamp, width=200, anchor="w").grid(
-                row=row_idx, column=0, padx=2, pady=4, sticky="ew")
-
-            emp_label = ctk.CTkLabel(table_frame, text=emp_name, width=150, text_color="black",
-                                     fg_color="#ffebee", corner_radius=8, height=28)
-            emp_label.grid(row=row_idx, column=1, padx=2, pady=4)
-
-            ctk.CTkLabel(table_frame, text=device, width=120).grid(
-                row=row_idx, column=2, padx=2, pady=4)
-
-            ctk.CTkButton(table_frame, text="👁️ VIEW", width=90, height=28,
-                          fg_color="#3498db", hover_color="#2980b9",
-                          command=lambda p=img_path: self.open_violation_photo(p)).grid(
-                row=row_idx, column=3, padx=2, pady=4)
+        # Native Treeview: one widget for the whole table instead of 5 CTk widgets per row
+        style = ttk.Style(dashboard)
+        style.theme_use("clam")  # native Windows theme ignores custom colors
+        style.configure("Dashboard.Treeview", background="#2b2b2b", fieldbackground="#2b2b2b",
+                        foreground="white", rowheight=32, font=("Arial", 12))
+        style.configure("Dashboard.Treeview.Heading", background="#1a1a1a", foreground="white",
+                        font=("Arial", 13, "bold"))
+        style.map("Dashboard.Treeview", background=[("selected", "#3498db")])
+
+        # img_path is kept as a hidden column for the VIEW action
+        tree = ttk.Treeview(table_frame, columns=("ts", "emp", "dev", "status", "img_path"),
+                            displaycolumns=("ts", "emp", "dev", "status"),
+                            show="headings", style="Dashboard.Treeview")
+        for col, header, width in [("ts", "Date & Time", 200), ("emp", "👤 Employee", 150),
+                                   ("dev", "📱 Device", 120), ("status", "✅ Status", 100)]:
+            tree.heading(col, text=header)
+            tree.column(col, width=width, anchor="w" if col == "ts" else "center")
+        tree.tag_configure("saved", foreground="#2ecc71")
+        tree.tag_configure("missing", foreground="#e74c3c")
+
+        scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        tree.pack(side="left", fill="both", expand=True)
+
+        def view_selected(event=None):
+            selected = tree.focus()
+            if not selected:
+                messagebox.showinfo("📸 View Photo", "Select a violation first.", parent=dashboard)
+                return
+            self.open_violation_photo(tree.set(selected, "img_path"))
 
-            status_color = "#2ecc71" if "Saved" in status else "#e74c3c"
-            ctk.CTkLabel(table_frame, text=status, width=100, fg_color=status_color).grid(
-                row=row_idx, column=4, padx=2, pady=4)
+        tree.bind("<Double-1>", view_selected)
 
         controls_frame = ctk.CTkFrame(dashboard)
         controls_frame.pack(fill="x", padx=20, pady=20)
@@ -447,10 +746,57 @@ class SafeDeskApp(ctk.CTk):
                       width=220, height=45, font=ctk.CTkFont(size=16),
                       command=self.export_manager_report_auto_open).pack(side="left", padx=15, pady=15)
 
+        ctk.CTkButton(controls_frame, text="👁️ VIEW Selected Photo", fg_color="#3498db",
+                      hover_color="#2980b9", width=200, height=45, font=ctk.CTkFont(size=16),
+                      command=view_selected).pack(side="left", padx=15, pady=15)
+
+        load_more_btn = ctk.CTkButton(controls_frame, text="⬇️ Load More", fg_color="#7f8c8d",
+                                      hover_color="#95a5a6", width=160, height=45,
+                                      font=ctk.CTkFont(size=16))
+        load_more_btn.pack(side="left", padx=15, pady=15)
+
         ctk.CTkButton(controls_frame, text="🗑️ Clear ALL Data", fg_color="#e74c3c",
                       width=180, height=45, font=ctk.CTkFont(size=16),
                       command=self.clear_all_violations).pack(side="right", padx=15, pady=15)
 
+        # Pagination cursor belongs to this window, not the app
+        last_id = None
+
+        def load_more():
+            nonlocal last_id
+            last_id = self._load_dashboard_page(tree, load_more_btn, last_id)
+
+        load_more_btn.configure(command=load_more)
+        load_more()
+
+    def _load_dashboard_page(self, tree, load_more_btn, last_id):
+        """Append the next DASHBOARD_PAGE_SIZE violations older than last_id; returns the new cursor"""
+        before_id = last_id if last_id is not None else sys.maxsize
+        violations = cursor.execute(DASHBOARD_PAGE_SQL, (before_id, DASHBOARD_PAGE_SIZE)).fetchall()
+
+        for row in violations:
+            timestamp = row["timestamp"]
+            emp_name = row["employee_name"]
+            device = row["object_detected"]
+            img_path = str(row["image_path"]) if row["image_path"] else ""
+
+            if device and ("C:\\" in str(device) or "violation_" in str(device)):
+                img_path = str(device)
+                device = str(emp_name)
+                try:
+                    emp_name = os.getlogin()
+                except:
+                    emp_name = "User"
+
+            photo_saved = os.path.exists(img_path)
+            status = "✅ Photo Saved" if photo_saved else "❌ Missing"
+            tree.insert("", "end", values=(timestamp, emp_name, device, status, img_path),
+                        tags=("saved" if photo_saved else "missing",))
+
+        if len(violations) < DASHBOARD_PAGE_SIZE:
+            load_more_btn.configure(state="disabled", text="✅ All Loaded")
+        return violations[-1]["id"] if violations else last_id
+
     def open_violation_photo(self, img_path):
         if not img_path or not os.path.exists(img_path):
             messagebox.showerror("❌ Error", "Photo file not found!")
@@ -477,9 +823,7 @@ class SafeDeskApp(ctk.CTk):
 
             photo_win.protocol("WM_DELETE_WINDOW", on_window_close)
 
-            img = PILImage.open(img_path)
-            max_size = (650, 480)
-            img.thumbnail(max_size)
+            img = load_thumbnail(img_path, os.path.getmtime(img_path))
             ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
 
             img_label = ctk.CTkLabel(photo_win, image=ctk_img, text="")
@@ -494,31 +838,26 @@ class SafeDeskApp(ctk.CTk):
                 del self.open_photo_windows[img_path]
 
     def export_manager_report_auto_open(self):
-        try:
-            df = pd.read_sql_query("""
-                SELECT 
-                    timestamp as 'Date & Time',
-                    employee_name as 'Employee Name', 
-                    object_detected as 'Device Detected',
-                    CASE 
-                        WHEN DATE(timestamp)=DATE('now') THEN '🟢 TODAY'
-                        WHEN DATE(timestamp)=DATE('now','-1 day') THEN '🟡 YESTERDAY'
-                        ELSE '🔵 PREVIOUS'
-                    END as 'Period',
-                    image_path as 'Photo Evidence'
-                FROM violations ORDER BY timestamp DESC
-            """, conn)
-
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"SafeDesk_Manager_Report_{timestamp}.xlsx"
-
-            desktop_path = os.path.join(os.path.expanduser("~"), "Desktop", filename)
-            df.to_excel(desktop_path, index=False)
-
-            os.startfile(desktop_path)
-
-        except Exception as e:
-            messagebox.showerror("❌ Error", f"Export failed:\n{str(e)}")
+        query = """
+            SELECT 
+                timestamp as 'Date & Time',
+                employee_name as 'Employee Name', 
+                object_detected as 'Device Detected',
+                CASE 
+                    WHEN DATE(timestamp)=DATE('now') THEN '🟢 TODAY'
+                    WHEN DATE(timestamp)=DATE('now','-1 day') THEN '🟡 YESTERDAY'
+                    ELSE '🔵 PREVIOUS'
+                END as 'Period',
+                image_path as 'Photo Evidence'
+            FROM violations ORDER BY timestamp DESC
+        """
+
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        filename = f"SafeDesk_Manager_Report_{timestamp}.xlsx"
+        desktop_path = os.path.join(os.path.expanduser("~"), "Desktop", filename)
+
+        threading.Thread(target=self._do_export, args=(query, desktop_path, "Export failed"),
+                         daemon=True).start()
 
     def clear_all_violations(self):
         if messagebox.askyesno("⚠️ CONFIRM DELETE", "Delete ALL violation records?\nThis cannot be undone!"):
@@ -575,10 +914,24 @@ class SafeDeskApp(ctk.CTk):
         self.open_photo_windows.clear()
 
         self.stop_monitoring()
+        self._close_when_writer_done()
+
+    def _close_when_writer_done(self):
+        """Wait for queued violations to be saved, then shut down.
+
+        Polled instead of join(): the writer posts to Tk with after(), which
+        blocks until the main loop runs, so joining here could deadlock.
+        """
+        if self._writer is not None and self._writer.is_alive():
+            self.after(50, self._close_when_writer_done)
+            return
         conn.close()
         self.destroy()
 
 
 if __name__ == "__main__":
+    if "--export-int8" in sys.argv:
+        sys.exit(0 if export_int8_models() else 1)
+
     app = SafeDeskApp()
-    app.mainloop()
\ No newline at end of file
+    app.mainloop()